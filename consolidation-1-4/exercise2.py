@@ -10,6 +10,7 @@ from helpers.task import TaskBase, get_input, task_to_list
 class Task(TaskBase):
     """Counted loops and conditional flow: Ant movement tracing"""
 
+    __slots__ = ("x_pos", "y_pos")
     tasklist = []
 
     def __init__(self, name="", output=True) -> None:
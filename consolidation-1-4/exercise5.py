@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Lists and Tuples"""
 
     tasklist = []
+    parallel = True
 
     @task_to_list(tasklist)
     def exercise5(self):
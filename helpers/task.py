@@ -1,9 +1,10 @@
 """contains the helper functions for the tasks and sessions"""
 
-import glob
-import importlib
+import importlib.util
+import os
 import sys
-from os.path import basename, dirname, isfile, join
+import threading
+from os.path import dirname, join
 
 
 def task_to_list(tasklist):
@@ -65,16 +66,24 @@ def get_input(
 class TaskBase:
     """Base class for tasks."""
 
+    __slots__ = ("name", "output", "_buf")
     tasklist = []
+    # set to True in tasks that never prompt for input or plot,
+    # so that their session may run in a worker thread
+    parallel = False
 
     def __init__(self, name="", output=True) -> None:
-        """Initialize a TaskBase object."""
+        """Initialize a TaskBase object.
+        Logged lines are buffered and written together by flush_log."""
         self.name = name
         self.output = output
+        self._buf = []
         self.log("################")
         self.log(f"running Task {self.name}...")
         self.log(self.__doc__)
         self.log("################")
+        # subclasses may prompt for input after this
+        self.flush_log()
 
     # @staticmethod
     # def int_input(varname, debug=False):
@@ -100,30 +109,93 @@ class TaskBase:
 
     def run_tasks(self):
         """Run all tasks in the tasklist."""
-        for task in self.tasklist:
-            self.log(task.__doc__)
+        tasks = self.tasklist
+        if not self.output:
+            for task in tasks:
+                task(self)
+            return
+        log = self.log
+        flush_log = self.flush_log
+        for task in tasks:
+            log(task.__doc__)
+            # tasks may prompt for input, so show what came before first
+            flush_log()
             res = task(self)
             if res:
-                self.log(task.__name__, **res)
-            self.log("\n")
-        self.log("done")
-        self.log("################")
+                log(task.__name__, **res)
+            log("\n")
+        log("done")
+        log("################")
+        flush_log()
 
     def log(self, msg, **kwargs):
-        """Print a message with variables.
+        """Buffer a message with variables.
         Checks if output is enabled."""
         if not self.output:
             return
-        if not kwargs:
-            print(msg)
-            return msg
-        var_list = []
-        msg += ":"
-        for key, value in kwargs.items():
-            var_list.append(f"{key} = {value}")
-        var_str = "; ".join(var_list)
-        print(msg, var_str)
-        return f"{msg} {var_str}"
+        if kwargs:
+            var_str = "; ".join(f"{key} = {value}" for key, value in kwargs.items())
+            msg = f"{msg}: {var_str}"
+        self._buf.append(str(msg))
+        return msg
+
+    def flush_log(self):
+        """Write all buffered messages to stdout at once."""
+        if not self._buf:
+            return
+        text = "\n".join(self._buf) + "\n"
+        self._buf.clear()
+        sys.stdout.write(text)
+
+
+def _load_module(modname, path):
+    """Import a module directly from its file path.
+    Avoids searching sys.path for a file that is already known."""
+    parent, _, child = modname.rpartition(".")
+    spec = importlib.util.spec_from_file_location(modname, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[modname] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[modname]
+        raise
+    if parent:
+        # bind as an attribute of the package, as a regular import does
+        setattr(importlib.import_module(parent), child, mod)
+    return mod
+
+
+def _session_modules(file, subdir=""):
+    """Import the task files in directory of the file, one at a time.
+    Optional argument dir can be used to specify a child directory.
+    Ignores main.py and files starting with _."""
+
+    with os.scandir(join(dirname(file), subdir)) as entries:
+        files = sorted(
+            (
+                entry
+                for entry in entries
+                if entry.name.endswith(".py")
+                and entry.name != "main.py"
+                and not entry.name.startswith(("_", "."))
+                and entry.is_file(follow_symlinks=False)
+            ),
+            key=lambda entry: entry.name,
+        )
+    package = subdir.replace("/", ".").replace("\\", ".")
+    for entry in files:
+        name = entry.name[:-3]
+        modname = f"{package}.{name}" if package else name
+        yield sys.modules.get(modname) or _load_module(modname, entry.path)
+
+
+def session_is_parallel(file, subdir=""):
+    """Check if every task in directory of the file is marked parallel."""
+    return all(
+        getattr(getattr(mod, "Task", None), "parallel", False)
+        for mod in _session_modules(file, subdir)
+    )
 
 
 def run_session(file, subdir=""):
@@ -131,17 +203,7 @@ def run_session(file, subdir=""):
     Optional argument dir can be used to specify a child directory.
     Ignores main.py and files starting with _."""
 
-    files = sorted(glob.glob(join(dirname(file), subdir, "*.py")))
-    for _file in files:
-        if not isfile(_file):
-            continue
-        fname = basename(_file)
-        if _file.endswith("main.py") or fname.startswith("_"):
-            continue
-        subdir = subdir.replace("/", ".").replace("\\", ".")
-        modname = f"{subdir}.{fname[:-3]}" if subdir else fname[:-3]
-        importlib.import_module(modname)
-        mod = sys.modules[modname]
+    for mod in _session_modules(file, subdir):
         try:
             mod.Task(mod.__name__).run_tasks()
         except AttributeError as err:
@@ -149,3 +211,38 @@ def run_session(file, subdir=""):
         except ValueError as err:
             print(err)
         print("\n")
+
+
+class ThreadOutput:
+    """Stand-in for sys.stdout while sessions run in threads.
+    Writes from a thread inside capture are kept for that thread,
+    all other writes go to the wrapped stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self, func, *args):
+        """Call func and return everything it wrote."""
+        self._local.buf = buf = []
+        try:
+            func(*args)
+        finally:
+            del self._local.buf
+        return "".join(buf)
+
+    def write(self, text):
+        """Write text to the thread's buffer or the wrapped stream."""
+        buf = getattr(self._local, "buf", None)
+        if buf is None:
+            return self.stream.write(text)
+        buf.append(text)
+        return len(text)
+
+    def flush(self):
+        """Flush the wrapped stream unless the thread is capturing."""
+        if getattr(self._local, "buf", None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
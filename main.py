@@ -1,11 +1,19 @@
 """finds all sessions in the current directory and runs them via input"""
 
-import argparse
+import functools
 import os
 import sys
+import time
+from itertools import chain
 
 from helpers import task
-from string import Template
+
+# cache of session directory listings and their name sets, keyed by
+# directory and invalidated when the directory mtime changes
+_SESSIONS_CACHE: dict[str, tuple[int, list[str], frozenset[str]]] = {}
+# directory timestamps can be coarser than the time between two changes,
+# so listings of a directory modified this recently are not cached
+_RACY_NS = 1_000_000_000
 
 
 def validate_session_decorator(func):
@@ -28,9 +36,27 @@ def validate_input_decorator(func):
     return wrapper
 
 
+@functools.lru_cache(maxsize=2)
+def _load_template(name):
+    """Load and cache a str.format template from helpers/templates."""
+    path = os.path.join(os.path.dirname(__file__), "helpers", "templates", name)
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _load_main_template():
+    """Get the template for a session main.py."""
+    return _load_template("main.txt")
+
+
+def _load_task_template():
+    """Get the template for a task file."""
+    return _load_template("task.txt")
+
+
 def flatten(list_of_lists):
     """Flatten a list of lists."""
-    return [item for sublist in list_of_lists for item in sublist]
+    return list(chain.from_iterable(list_of_lists))
 
 
 class SessionRunner:
@@ -39,25 +65,47 @@ class SessionRunner:
     inputs = []
     session_prefix = ("session", "consolidation")
 
-    def __init__(self):
-        pass
+    def __init__(self, jobs=1):
+        self.jobs = jobs
 
     @staticmethod
-    def get_sessions(file=__file__):
-        """Get all sessions in a directory."""
-        sessions = []
+    def _scan_sessions(file=__file__):
+        """Get the cached listing of sessions in a directory.
+        The listing is rebuilt when the directory is modified.
+        Entry types come from the directory listing itself, so only
+        entries matching the session prefix may need a stat."""
         directory = os.path.dirname(file)
-        for _file in os.listdir(directory):
-            if not os.path.isdir(os.path.join(directory, _file)):
-                continue
-            if _file.startswith(SessionRunner.session_prefix):
-                sessions.append(_file)
-        return sorted(sessions)
+        mtime = os.stat(directory).st_mtime_ns
+        cached = _SESSIONS_CACHE.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached
+        scanned = time.time_ns()
+        with os.scandir(directory) as entries:
+            sessions = sorted(
+                sys.intern(entry.name)
+                for entry in entries
+                if entry.name.startswith(SessionRunner.session_prefix)
+                and entry.is_dir(follow_symlinks=False)
+            )
+        cached = (mtime, sessions, frozenset(sessions))
+        if scanned - mtime > _RACY_NS:
+            _SESSIONS_CACHE[directory] = cached
+        else:
+            # a change in the same timestamp tick would keep this mtime
+            _SESSIONS_CACHE.pop(directory, None)
+        return cached
+
+    @staticmethod
+    def get_sessions(file=__file__):
+        """Get all sessions in a directory.
+        Results are cached until the directory is modified."""
+        return list(SessionRunner._scan_sessions(file)[1])
 
     @classmethod
     def validate_session(cls, session, file=__file__):
-        """Validate a session name."""
-        if session not in cls.get_sessions(file):
+        """Validate a session name.
+        Results are cached until the directory is modified."""
+        if session not in cls._scan_sessions(file)[2]:
             raise ValueError(f"Session {session} not found.")
         return True
 
@@ -67,7 +115,7 @@ class SessionRunner:
         if "all" in inputs:
             cls.inputs = ["all"]
             return True
-        sessions = cls.get_sessions(file)
+        _, sessions, session_set = cls._scan_sessions(file)
         valid_inputs = []
         for i in inputs:
             if i == "":
@@ -78,7 +126,8 @@ class SessionRunner:
                     raise ValueError(f"Invalid input {i}.")
                 valid_inputs.append(sessions[i - 1])
             else:
-                if i not in sessions:
+                i = sys.intern(i)
+                if i not in session_set:
                     raise ValueError(f"Invalid input {i}.")
                 valid_inputs.append(i)
         if not valid_inputs:
@@ -97,17 +146,47 @@ class SessionRunner:
             print("~~~~~~~~~~~~~~~~~~~~\n")
 
     def run_all_sessions(self, file=__file__):
-        """Run all sessions."""
-        for session in self.get_sessions(file):
-            self.run_session(session, file)
+        """Run all sessions.
+        When jobs is greater than 1, sessions whose tasks are all marked
+        parallel run in a thread pool and the rest run in this thread.
+        Output of each session is written in one go, in session order."""
+        sessions = self.get_sessions(file)
+        parallel = []
+        if self.jobs > 1:
+            parallel = [s for s in sessions if task.session_is_parallel(file, s)]
+        if not parallel:
+            for session in sessions:
+                self.run_session(session, file)
+            return
+        # only needed for parallel runs, and slow to import
+        from concurrent.futures import ThreadPoolExecutor
+
+        stdout = sys.stdout
+        sys.stdout = output = task.ThreadOutput(stdout)
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                futures = {
+                    session: executor.submit(
+                        output.capture, self.run_session, session, file
+                    )
+                    for session in parallel
+                }
+                for session in sessions:
+                    if session in futures:
+                        stdout.write(futures[session].result())
+                    else:
+                        self.run_session(session, file)
+        finally:
+            sys.stdout = stdout
 
     @validate_input_decorator
     def run_session_input(self, inputs, file=__file__):
-        """Run a session based on user input."""
+        """Run a session based on user input.
+        Each session is run once, in the order it was first selected."""
         if self.inputs == ["all"]:
             self.run_all_sessions(file)
         else:
-            for session in self.inputs:
+            for session in dict.fromkeys(self.inputs):
                 self.run_session(session, file)
 
     def user_select(self, file=__file__, debug=False):
@@ -145,31 +224,37 @@ class SessionRunner:
             print(f"Name must start with {SessionRunner.session_prefix}")
             raise ValueError(f"Invalid session name {session_name}.")
         # create directory
+        if os.path.lexists(session_name):
+            print("Session name already exists, exiting...")
+            raise ValueError(f"Invalid session name {session_name}.")
         try:
             os.makedirs(session_name)
-        except FileExistsError:
+        except FileExistsError as err:
+            # created after the check above
             print("Session name already exists, exiting...")
-            raise ValueError(f"Invalid session name {session_name}.")
+            raise ValueError(f"Invalid session name {session_name}.") from err
+        _SESSIONS_CACHE.pop(os.path.dirname(os.path.abspath(session_name)), None)
         # create main.py
-        with open("helpers/templates/main.txt", "r", encoding="utf-8") as f:
-            main_template = Template(f.read())
+        main_template = _load_main_template()
         with open(f"{session_name}/main.py", "w", encoding="utf-8") as f:
             session_doc = input("Enter session description: ")
-            f.write(main_template.substitute(docstring=session_doc))
+            f.write(main_template.format(docstring=session_doc))
 
     @validate_session_decorator
     def create_task(self, session, file=__file__):
         """Create a task."""
         task_name = input("Enter task name: ")
-        with open("helpers/templates/task.txt", "r") as f:
-            task_template = Template(f.read())
+        task_template = _load_task_template()
         with open(f"{session}/{task_name}.py", "w", encoding="utf-8") as f:
             task_doc = input("Enter task description: ")
             task_d = {"docstring": task_doc, "name": task_name.title()}
-            f.write(task_template.substitute(task_d))
+            f.write(task_template.format(**task_d))
 
 
 if __name__ == "__main__":
+    # only needed for the command line, not when imported
+    import argparse
+
     try:
         parser = argparse.ArgumentParser(description="run me1 sessions tasks")
         parser.add_argument(
@@ -196,15 +281,23 @@ if __name__ == "__main__":
             "--task",
             help="create task in existing session",
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="number of sessions to run in parallel with --all "
+            "(only sessions whose tasks are all marked parallel)",
+        )
         args = parser.parse_args()
         if args.all:
-            SessionRunner().run_all_sessions()
+            SessionRunner(args.jobs).run_all_sessions()
         elif args.create:
             SessionRunner().create_session()
         elif args.task:
             SessionRunner().create_task(args.task)
         elif args.session:
-            SessionRunner().run_session_input(flatten(args.session))
+            SessionRunner(args.jobs).run_session_input(flatten(args.session))
         else:
             SessionRunner().user_select()
     except ValueError as err:
@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Perform a list of instructions"""
 
     tasklist = []
+    parallel = True
 
     @task_to_list(tasklist)
     def task1(self):
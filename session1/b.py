@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Assignments and basic variable operations"""
 
     tasklist = []
+    parallel = True
 
     @task_to_list(tasklist)
     def task1(self):
@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Swapping"""
 
     tasklist = []
+    parallel = True
     a = 0
     b = 0
     c = 0
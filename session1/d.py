@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Type conversion"""
 
     tasklist = []
+    parallel = True
     a = None
     b = None
     c = None
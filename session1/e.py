@@ -1,22 +1,24 @@
 """Creating Lists"""
 
+import numpy as np
+
 from helpers.task import TaskBase, task_to_list
 
 
 class Task(TaskBase):
     """Creating Lists"""
 
+    __slots__ = ("A", "B")
     tasklist = []
-    A = None
-    B = None
+    parallel = True
 
     @task_to_list(tasklist)
     def task1(self):
         """Create manually two lists A and B,
         with integer values from 10 to 20 (included)
         and from 20 to 30 (included), respectively."""
-        self.A = list(range(10, 21))
-        self.B = list(range(20, 31))
+        self.A = np.arange(10, 21, dtype=np.int64)
+        self.B = np.arange(20, 31, dtype=np.int64)
         return {"A": self.A, "B": self.B}
 
     @task_to_list(tasklist)
@@ -31,7 +33,7 @@ class Task(TaskBase):
     @task_to_list(tasklist)
     def task3(self):
         """Swap the first and the last elements of A."""
-        self.A[0], self.A[-1] = self.A[-1], self.A[0]
+        self.A[[0, -1]] = self.A[[-1, 0]]
         return {"A": self.A}
 
     @task_to_list(tasklist)
@@ -1,28 +1,41 @@
 """Slicing and concatenation"""
 
+import functools
+
+import numpy as np
+
 import session1.e
 from helpers.task import TaskBase, task_to_list
 
 
+@functools.lru_cache(maxsize=1)
+def _task_e_lists():
+    """Run Task E once and cache its final lists A and B."""
+    task_e = session1.e.Task(output=False)
+    task_e.run_tasks()
+    return task_e.A, task_e.B
+
+
 class Task(TaskBase):
     """Slicing and concatenation"""
 
-    # Following up from Task E:
+    __slots__ = ("A", "B", "C", "D", "E", "F", "G")
     tasklist = []
-    TaskE = session1.e.Task(output=False)
-    TaskE.run_tasks()
-    A = TaskE.A
-    B = TaskE.B
-    C = []
-    D = []
-    E = []
-    F = []
-    G = []
+    parallel = True
+
+    def __init__(self, name="", output=True) -> None:
+        super().__init__(name, output)
+        # Following up from Task E:
+        # copies keep each run from changing the cached lists
+        task_e_a, task_e_b = _task_e_lists()
+        self.A = task_e_a.copy()
+        self.B = task_e_b.copy()
 
     @task_to_list(tasklist)
     def task1(self):
         """Slice the first six elements of list A and assign it to list C."""
-        self.C = self.A[:6]
+        # copy so that later changes to C do not write through to A
+        self.C = self.A[:6].copy()
         return {"C": self.C}
 
     @task_to_list(tasklist)
@@ -34,7 +47,7 @@ class Task(TaskBase):
     @task_to_list(tasklist)
     def task3(self):
         """Concatenate list C and D into list E."""
-        self.E = self.C + self.D
+        self.E = np.concatenate((self.C, self.D))
         return {"E": self.E}
 
     @task_to_list(tasklist)
@@ -42,15 +55,15 @@ class Task(TaskBase):
         """Print out list E and slice the central part,
         from cell with value 13 to cell with value 26 included,
         and assign it to list F"""
-        i = self.E.index(13)
-        j = self.E.index(26)
+        i = np.flatnonzero(self.E == 13)[0]
+        j = np.flatnonzero(self.E == 26)[0]
         self.F = self.E[i : j + 1]
         return {"F": self.F}
 
     @task_to_list(tasklist)
     def task5(self):
         """Concatenate list F with list C, into list G."""
-        self.G = self.F + self.C
+        self.G = np.concatenate((self.F, self.C))
         return {"G": self.G}
 
     @task_to_list(tasklist)
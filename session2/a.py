@@ -7,6 +7,7 @@ class Task(TaskBase):
     """Generating lists"""
 
     tasklist = []
+    parallel = True
     A = []
     B = []
     C = []
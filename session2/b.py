@@ -8,6 +8,7 @@ class Task(TaskBase):
     """Managing lists"""
 
     tasklist = []
+    parallel = True
     TaskA = session2.a.Task(output=False)
     TaskA.run_tasks()
     A = TaskA.A
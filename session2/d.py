@@ -25,6 +25,7 @@ class Player:
 class Task(TaskBase):
     """Conditional flow"""
 
+    __slots__ = ("X", "Y")
     tasklist = []
 
     def __init__(self, name="", output=True) -> None:
@@ -11,6 +11,7 @@ from helpers.task import TaskBase, get_input, task_to_list
 class Task(TaskBase):
     """Prime numbers"""
 
+    __slots__ = ("limit",)
     tasklist = []
 
     def __init__(self, name="", output=True) -> None:
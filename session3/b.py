@@ -7,6 +7,7 @@ class Task(TaskBase):
     """I/O Files"""
 
     tasklist = []
+    parallel = True
     marks = []
 
     def import_marks(self):
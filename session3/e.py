@@ -6,6 +6,7 @@ from helpers.task import RangeValidator, TaskBase, get_input, task_to_list
 class Task(TaskBase):
     """Series expansions"""
 
+    __slots__ = ("x_input", "q_input", "accuracy", "approx")
     tasklist = []
 
     def __init__(self, name="", output=True) -> None:
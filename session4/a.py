@@ -7,6 +7,7 @@ class Task(TaskBase):
     """List of tuples"""
 
     tasklist = []
+    parallel = True
     combined_list = []
 
     @task_to_list(tasklist)
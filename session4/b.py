@@ -8,6 +8,7 @@ class Task(TaskBase):
     """Sorting algorithm"""
 
     tasklist = []
+    parallel = True
 
     TaskA = session4.a.Task(output=False)
     TaskA.run_tasks()
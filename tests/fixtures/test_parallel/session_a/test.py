@@ -0,0 +1,18 @@
+import threading
+import time
+
+
+class Task:
+    parallel = True
+
+    def __init__(self, name) -> None:
+        pass
+
+    def run_tasks(self):
+        for i in range(3):
+            print("a", i)
+            time.sleep(0.01)
+        if threading.current_thread() is threading.main_thread():
+            print("a main")
+        else:
+            print("a worker")
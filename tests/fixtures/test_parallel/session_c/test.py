@@ -0,0 +1,12 @@
+import threading
+
+
+class Task:
+    def __init__(self, name) -> None:
+        pass
+
+    def run_tasks(self):
+        if threading.current_thread() is threading.main_thread():
+            print("c main")
+        else:
+            print("c worker")
@@ -1,13 +1,18 @@
 """test the main module."""
 
+import os
+import time
 from os.path import dirname, join
 
 import pytest
 
-from main import (SessionRunner, validate_input_decorator,
+from main import (SessionRunner, flatten, validate_input_decorator,
                   validate_session_decorator)
 
 FXT_DIR = join(dirname(__file__), "fixtures/test_root/")
+PAR_DIR = join(dirname(__file__), "fixtures/test_parallel/")
+# a directory mtime far enough in the past to be cached
+OLD_NS = 1_000_000_000_000_000_000
 
 
 def test_validate_session_decorator():
@@ -43,6 +48,12 @@ def test_validate_input_decorator():
         test(SessionRunner, [""], FXT_DIR)
 
 
+def test_flatten():
+    """Test flatten method."""
+    assert flatten([["1", "2"], [], ["3"]]) == ["1", "2", "3"]
+    assert flatten([]) == []
+
+
 class TestSessionRunner:
     """Test the SessionRunner class."""
 
@@ -53,6 +64,36 @@ class TestSessionRunner:
         sessions = self.session_runner.get_sessions(FXT_DIR)
         assert sessions == ["session1", "session2"]
 
+    def test_get_sessions_cache(self, tmp_path):
+        """Test get_sessions picks up changes to the directory."""
+        (tmp_path / "session1").mkdir()
+        file = join(tmp_path, "main.py")
+        # set mtimes explicitly so the test does not depend on the clock
+        os.utime(tmp_path, ns=(OLD_NS, OLD_NS))
+        assert self.session_runner.get_sessions(file) == ["session1"]
+        # returned list should not alias the cache
+        self.session_runner.get_sessions(file).append("session9")
+        assert self.session_runner.get_sessions(file) == ["session1"]
+        # test listing is reused while the mtime is unchanged
+        (tmp_path / "session2").mkdir()
+        os.utime(tmp_path, ns=(OLD_NS, OLD_NS))
+        assert self.session_runner.get_sessions(file) == ["session1"]
+        # test listing is rebuilt when the mtime changes
+        os.utime(tmp_path, ns=(OLD_NS + 1, OLD_NS + 1))
+        sessions = self.session_runner.get_sessions(file)
+        assert sessions == ["session1", "session2"]
+
+    def test_get_sessions_racy(self, tmp_path):
+        """Test get_sessions does not cache a recently modified directory."""
+        file = join(tmp_path, "main.py")
+        now = time.time_ns()
+        os.utime(tmp_path, ns=(now, now))
+        assert self.session_runner.get_sessions(file) == []
+        # a change within the same timestamp tick keeps the mtime
+        (tmp_path / "session1").mkdir()
+        os.utime(tmp_path, ns=(now, now))
+        assert self.session_runner.get_sessions(file) == ["session1"]
+
     def test_validate_session(self):
         """Test validate_session method."""
         # test valid session
@@ -61,6 +102,22 @@ class TestSessionRunner:
         with pytest.raises(ValueError):
             self.session_runner.validate_session("session3", FXT_DIR)
 
+    def test_validate_session_cache(self, tmp_path):
+        """Test validate_session cache is refreshed with the sessions."""
+        file = join(tmp_path, "main.py")
+        # set mtimes explicitly so the test does not depend on the clock
+        os.utime(tmp_path, ns=(OLD_NS, OLD_NS))
+        with pytest.raises(ValueError):
+            SessionRunner.validate_session("session1", file)
+        (tmp_path / "session1").mkdir()
+        os.utime(tmp_path, ns=(OLD_NS + 1, OLD_NS + 1))
+        assert SessionRunner.validate_session("session1", file) is True
+        # test removed session is no longer valid
+        (tmp_path / "session1").rmdir()
+        os.utime(tmp_path, ns=(OLD_NS + 2, OLD_NS + 2))
+        with pytest.raises(ValueError):
+            SessionRunner.validate_session("session1", file)
+
     def test_validate_input(self):
         """Test validate_input method."""
         # test valid input
@@ -89,6 +146,22 @@ class TestSessionRunner:
         self.session_runner.run_all_sessions(__file__)
         capture = capsys.readouterr()
         assert capture.out == "test\n\n\n"
+        # test unmarked sessions are not run in parallel
+        SessionRunner(jobs=2).run_all_sessions(__file__)
+        capture = capsys.readouterr()
+        assert capture.out == "test\n\n\n"
+
+    def test_run_all_sessions_parallel(self, capsys, monkeypatch):
+        """Test run_all_sessions method with jobs."""
+        monkeypatch.syspath_prepend(PAR_DIR)
+        SessionRunner(jobs=2).run_all_sessions(PAR_DIR)
+        capture = capsys.readouterr()
+        # marked sessions run in workers without interleaving,
+        # unmarked sessions run in the main thread
+        expected = "".join(
+            f"{x} 0\n{x} 1\n{x} 2\n{x} worker\n\n\n" for x in "ab"
+        )
+        assert capture.out == expected + "c main\n\n\n"
 
     def test_run_session_input(self, capsys):
         """Test run_session_input method."""
@@ -96,6 +169,11 @@ class TestSessionRunner:
         self.session_runner.run_session_input(["session_test"], __file__)
         capture = capsys.readouterr()
         assert capture.out == "test\n\n\n"
+        # test duplicate input runs once
+        inputs = ["session_test", "1", "session_test"]
+        self.session_runner.run_session_input(inputs, __file__)
+        capture = capsys.readouterr()
+        assert capture.out == "test\n\n\n"
         # test invalid input
         with pytest.raises(ValueError):
             self.session_runner.run_session_input(["3"], __file__)
@@ -136,3 +214,22 @@ class TestSessionRunner:
         monkeypatch.setattr("builtins.input", lambda _: "")
         with pytest.raises(ValueError):
             self.session_runner.user_select(file=__file__, debug=True)
+
+    def test_create_dir_and_main(self, monkeypatch, tmp_path):
+        """Test create_dir_and_main method."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("builtins.input", lambda _: "test doc")
+        # test valid name
+        self.session_runner.create_dir_and_main("session1")
+        main_file = tmp_path / "session1" / "main.py"
+        assert main_file.read_text(encoding="utf-8").startswith('"""test doc"""')
+        # test existing name
+        with pytest.raises(ValueError):
+            self.session_runner.create_dir_and_main("session1")
+        # test name created after the existence check
+        monkeypatch.setattr("os.path.lexists", lambda _: False)
+        with pytest.raises(ValueError):
+            self.session_runner.create_dir_and_main("session1")
+        # test invalid name
+        with pytest.raises(ValueError):
+            self.session_runner.create_dir_and_main("test")
@@ -1,9 +1,11 @@
 """test the task module."""
 
+import sys
+
 import pytest
 
-from helpers.task import (RangeValidator, TaskBase, get_input, run_session,
-                          task_to_list)
+from helpers.task import (RangeValidator, TaskBase, ThreadOutput, get_input,
+                          run_session, session_is_parallel, task_to_list)
 
 
 def test_task_to_list():
@@ -109,10 +111,37 @@ class TestTaskBase:
         # test log msg and kwargs with multiple values
         val = {"test": 1, "test2": 2}
         assert self.task_base.log("test", **val) == "test: test = 1; test2 = 2"
+        # test messages are buffered until flushed
+        assert self.task_base._buf[-1] == "test: test = 1; test2 = 2"
+        self.task_base._buf.clear()
         # test no output
         self.task_base.output = False
         assert self.task_base.log("test") is None
 
+    def test_run_tasks(self, capsys):
+        """Test run_tasks method."""
+
+        class Task(TaskBase):
+            tasklist = []
+            runs = 0
+
+            @task_to_list(tasklist)
+            def task1(self):
+                """task1 doc"""
+                self.runs += 1
+                return {"runs": self.runs}
+
+        # test output
+        task = Task("test")
+        task.run_tasks()
+        capture = capsys.readouterr()
+        assert "task1 doc\ntask1: runs = 1\n" in capture.out
+        # test no output still runs tasks
+        task.output = False
+        task.run_tasks()
+        assert task.runs == 2
+        assert capsys.readouterr().out == ""
+
 
 def test_run_session(capsys):
     """Test run_session method."""
@@ -120,3 +149,20 @@ def test_run_session(capsys):
     run_session(__file__, "fixtures/test_session")
     capture = capsys.readouterr()
     assert capture.out == "test1\n\n\nfixtures.test_session.test2\n\n\n"
+
+
+def test_session_is_parallel():
+    """Test session_is_parallel method."""
+    # test fixture tasks are not marked parallel
+    assert session_is_parallel(__file__, "fixtures/test_session") is False
+
+
+def test_thread_output(capsys):
+    """Test ThreadOutput class."""
+    output = ThreadOutput(sys.stdout)
+    # test captured writes are returned
+    assert output.capture(output.write, "test") == "test"
+    assert capsys.readouterr().out == ""
+    # test other writes go to the stream
+    output.write("test")
+    assert capsys.readouterr().out == "test"